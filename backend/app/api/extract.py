@@ -4,6 +4,7 @@ import logging
 import os
 import tempfile
 
+import anyio
 from fastapi import APIRouter, File, HTTPException, UploadFile
 
 from extractor.main import extract_from_path
@@ -29,7 +30,10 @@ async def extract_document(file: UploadFile = File(...)):
             tmp.write(payload)
             temp_path = tmp.name
 
-        return extract_from_path(temp_path, original_name=file.filename)
+        # Extraction is blocking (file parsing, OCR); keep it off the event loop.
+        return await anyio.to_thread.run_sync(
+            lambda: extract_from_path(temp_path, original_name=file.filename)
+        )
 
     except TimeoutError as exc:
         raise HTTPException(status_code=408, detail=str(exc)) from exc
@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 from collections import defaultdict
 from datetime import datetime, timedelta
+from operator import itemgetter
 from uuid import UUID
 
 from fastapi import HTTPException
@@ -60,7 +61,7 @@ async def get_events(db: AsyncSession, user_id: UUID) -> list[dict]:
     classroom_client, _ = await _get_classroom_client(db, user_id)
     courses = await asyncio.to_thread(classroom_client.get_courses)
 
-    events: list[dict] = []
+    keyed: list[tuple[tuple[str, str], dict]] = []
     for course in courses:
         course_id = course.get("id")
         course_name = course.get("name", "Unknown course")
@@ -88,21 +89,24 @@ async def get_events(db: AsyncSession, user_id: UUID) -> list[dict]:
             else:
                 submission_status = "assigned"
 
-            events.append(
+            title = item.get("title")
+            posted_at = item.get("posted_at")
+            keyed.append((
+                (due_date or posted_at or "0000-01-01", title or ""),
                 {
-                    "title": item.get("title"),
+                    "title": title,
                     "course": course_name,
                     "type": "Assignment",
                     "due_date": due_date,
-                    "posted_at": item.get("posted_at"),
+                    "posted_at": posted_at,
                     "submission_status": submission_status,
                     "workflow_status": raw_status,
                     "is_graded": raw_status == "graded",
                     "assigned_grade": item.get("assigned_grade"),
                     "submission_state": item.get("submission_state"),
                     "link": item.get("submission_url"),
-                }
-            )
+                },
+            ))
 
         try:
             announcements_items = await asyncio.to_thread(
@@ -114,22 +118,20 @@ async def get_events(db: AsyncSession, user_id: UUID) -> list[dict]:
             announcements_items = []
 
         for ann in announcements_items:
-            events.append(
+            title = ann.get("text", "Announcement")[:120]
+            created = ann.get("creationTime")
+            keyed.append((
+                (created or "0000-01-01", title or ""),
                 {
-                    "title": (ann.get("text", "Announcement")[:120]),
+                    "title": title,
                     "course": course_name,
                     "type": "Announcement",
-                    "due_date": ann.get("creationTime"),
-                    "posted_at": ann.get("creationTime"),
+                    "due_date": created,
+                    "posted_at": created,
                     "link": ann.get("alternateLink"),
-                }
-            )
+                },
+            ))
 
-    events.sort(
-        key=lambda e: (
-            e.get("due_date") or e.get("posted_at") or "0000-01-01",
-            e.get("title") or "",
-        ),
-        reverse=True,
-    )
-    return events
+    # Sort on the precomputed keys only; comparing the dicts themselves on a tie would raise.
+    keyed.sort(key=itemgetter(0), reverse=True)
+    return [event for _, event in keyed]
@@ -2,25 +2,15 @@ from __future__ import annotations
 
 import io
 import logging
-import time
 import re
 from urllib.parse import urljoin
 
 import pdfplumber
-import requests
 from bs4 import BeautifulSoup
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
-
-logger = logging.getLogger(__name__)
 
+from .throttle import cached_session, is_cached, wait_for_host
 
-def _session() -> requests.Session:
-    session = requests.Session()
-    retry = Retry(total=3, backoff_factor=0.7, status_forcelist=(429, 500, 502, 503, 504), allowed_methods=("GET",))
-    session.mount("http://", HTTPAdapter(max_retries=retry))
-    session.mount("https://", HTTPAdapter(max_retries=retry))
-    return session
+logger = logging.getLogger(__name__)
 
 
 def _normalize_lines(text: str) -> str:
@@ -48,8 +38,10 @@ def fetch_main_text(url: str, timeout: int = 20, rate_limit_seconds: float = 0.2
 
 
 def fetch_main_text_and_links(url: str, timeout: int = 20, rate_limit_seconds: float = 0.2) -> tuple[str, list[str]]:
-    session = _session()
-    time.sleep(rate_limit_seconds)
+    session = cached_session()
+    # Only real network requests count against the host's rate limit.
+    if not is_cached(session, url):
+        wait_for_host(url, rate_limit_seconds)
     resp = session.get(url, timeout=timeout)
     resp.raise_for_status()
 
@@ -57,7 +49,10 @@ def fetch_main_text_and_links(url: str, timeout: int = 20, rate_limit_seconds: f
     if url.lower().endswith(".pdf") or "application/pdf" in content_type:
         return _extract_pdf_text(resp.content), []
 
-    soup = BeautifulSoup(resp.text, "html.parser")
+    # Hand bs4 the raw bytes: it reads <meta charset> itself, so requests never has to decode
+    # (or guess the encoding of) the body. A charset from the HTTP header still takes precedence.
+    from_encoding = resp.encoding if "charset" in content_type else None
+    soup = BeautifulSoup(resp.content, "html.parser", from_encoding=from_encoding)
     for tag in soup(["script", "style", "nav", "footer", "header", "noscript"]):
         tag.decompose()
 
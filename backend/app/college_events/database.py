@@ -1,14 +1,16 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Sequence
 
-from sqlalchemy import select
+import orjson
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.integrations import CollegeEvent
 
+_BATCH_SIZE = 1000
+
 
 def _to_payload(event: CollegeEvent) -> dict:
     return {
@@ -22,39 +24,55 @@ def _to_payload(event: CollegeEvent) -> dict:
     }
 
 
+async def _existing_event_keys(db: AsyncSession, events: Sequence[dict]) -> set[tuple]:
+    colleges = {item["college"] for item in events}
+    source_urls = list({item["source_url"] for item in events})
+    keys: set[tuple] = set()
+    for start in range(0, len(source_urls), _BATCH_SIZE):
+        result = await db.execute(
+            select(
+                CollegeEvent.college,
+                CollegeEvent.event_name,
+                CollegeEvent.event_date,
+                CollegeEvent.source_url,
+            ).where(
+                CollegeEvent.college.in_(colleges),
+                CollegeEvent.source_url.in_(source_urls[start:start + _BATCH_SIZE]),
+            )
+        )
+        keys.update(tuple(row) for row in result.all())
+    return keys
+
+
 async def save_events_with_fallback(db: AsyncSession, events: Sequence[dict], fallback_path: Path) -> list[dict]:
-    persisted: list[dict] = []
+    if not events:
+        return []
 
     try:
+        # One lookup for everything already stored, then multi-row INSERTs for the rest.
+        seen = await _existing_event_keys(db, events)
+        rows: list[dict] = []
         for item in events:
-            exists = await db.execute(
-                select(CollegeEvent).where(
-                    CollegeEvent.college == item["college"],
-                    CollegeEvent.event_name == item["event_name"],
-                    CollegeEvent.event_date == item.get("date"),
-                    CollegeEvent.source_url == item["source_url"],
-                )
-            )
-            if exists.scalar_one_or_none():
-                persisted.append(item)
+            key = (item["college"], item["event_name"], item.get("date"), item["source_url"])
+            if key in seen:
                 continue
-
-            db.add(
-                CollegeEvent(
-                    college=item["college"],
-                    event_name=item["event_name"],
-                    event_type=item["event_type"],
-                    event_date=item.get("date"),
-                    semester=item.get("semester"),
-                    department=item.get("department"),
-                    source_url=item["source_url"],
-                )
+            seen.add(key)
+            rows.append(
+                {
+                    "college": item["college"],
+                    "event_name": item["event_name"],
+                    "event_type": item["event_type"],
+                    "event_date": item.get("date"),
+                    "semester": item.get("semester"),
+                    "department": item.get("department"),
+                    "source_url": item["source_url"],
+                }
             )
-            persisted.append(item)
 
-        await db.flush()
-        return persisted
+        for start in range(0, len(rows), _BATCH_SIZE):
+            await db.execute(insert(CollegeEvent), rows[start:start + _BATCH_SIZE])
+        return list(events)
     except Exception:
         fallback_path.parent.mkdir(parents=True, exist_ok=True)
-        fallback_path.write_text(json.dumps(list(events), indent=2), encoding="utf-8")
+        fallback_path.write_bytes(orjson.dumps(list(events), option=orjson.OPT_INDENT_2))
         return list(events)
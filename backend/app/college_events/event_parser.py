@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import re
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
 
 DATE_PATTERNS = [
     r"\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b",
@@ -9,69 +10,143 @@ DATE_PATTERNS = [
     r"\b(?:jan|january|feb|february|mar|march|apr|april|may|jun|june|jul|july|aug|august|sep|sept|september|oct|october|nov|november|dec|december)\s+\d{1,2},\s*\d{2,4}\b",
 ]
 
+# Tried in list order, not as one alternation: a line's date is the first pattern's
+# match, which is not always the leftmost date on the line.
+_DATE_RES = [re.compile(p, re.I) for p in DATE_PATTERNS]
+_SEM_RE = re.compile(r"\b(sem(?:ester)?\s*[1-8])\b", re.I)
+# Line separators are single characters, so str.translate + str.split replaces a regex split.
+_SPLIT_TABLE = str.maketrans({".": "\n", "|": "\n"})
 
+EVENT_KEYWORDS = [
+    "exam", "notice", "calendar", "timetable", "academic", "holiday", "lecture", "assignment",
+    "submission", "result", "orientation", "workshop", "vacation", "semester", "term",
+]
+_KEYWORD_RE = re.compile("|".join(EVENT_KEYWORDS), re.I)
+# Checked in order: the first type with a matching keyword wins, otherwise "Notice".
+EVENT_TYPE_KEYWORDS = {
+    "Exam": ["exam", "test", "assessment", "midsem", "endsem"],
+    "Holiday": ["holiday", "vacation", "break"],
+    "Lecture": ["lecture", "seminar", "workshop"],
+}
+DEPARTMENTS = ["computer", "it", "extc", "mechanical", "civil", "electronics", "electrical", "ai", "data science"]
+
+
+_DATE_FORMATS = (
+    "%d/%m/%Y", "%d-%m-%Y", "%d/%m/%y", "%d-%m-%y",
+    "%d %B %Y", "%d %b %Y", "%B %d, %Y", "%b %d, %Y",
+)
+_NUMERIC_DATE_RE = re.compile(r"(?P<d>\d{1,2})(?P<sep>[/-])(?P<m>\d{1,2})(?P=sep)(?P<y>\d{4}|\d{2})")
+_DAY_MONTH_RE = re.compile(r"(?P<d>\d{1,2})\s+(?P<mon>[a-z]+)\s+(?P<y>\d{4})", re.I)
+_MONTH_DAY_RE = re.compile(r"(?P<mon>[a-z]+)\s+(?P<d>\d{1,2}),\s+(?P<y>\d{4})", re.I)
+_MONTHS = {
+    name: number
+    for number, month in enumerate(
+        ["january", "february", "march", "april", "may", "june",
+         "july", "august", "september", "october", "november", "december"],
+        start=1,
+    )
+    for name in (month, month[:3])
+}
+
+
+def _match_date(raw: str) -> date | None:
+    """Build a date straight from regex fields for the shapes _DATE_FORMATS accept.
+
+    Raises ValueError when the fields are out of range, as strptime would.
+    """
+    match = _NUMERIC_DATE_RE.fullmatch(raw)
+    if match:
+        year = int(match["y"])
+        if len(match["y"]) == 2:
+            year += 1900 if year >= 69 else 2000  # strptime's %y pivot
+        return date(year, int(match["m"]), int(match["d"]))
+
+    match = _DAY_MONTH_RE.fullmatch(raw) or _MONTH_DAY_RE.fullmatch(raw)
+    if match:
+        month = _MONTHS.get(match["mon"].lower())
+        if month is not None:
+            return date(int(match["y"]), month, int(match["d"]))
+    return None
+
+
+@lru_cache(maxsize=4096)
 def _normalize_date(raw: str) -> str:
-    formats = [
-        "%d/%m/%Y", "%d-%m-%Y", "%d/%m/%y", "%d-%m-%y",
-        "%d %B %Y", "%d %b %Y", "%B %d, %Y", "%b %d, %Y",
-    ]
-    for fmt in formats:
+    try:
+        parsed = _match_date(raw)
+    except ValueError:
+        return raw
+    if parsed is not None:
+        return parsed.isoformat()
+
+    for fmt in _DATE_FORMATS:
         try:
             dt = datetime.strptime(raw, fmt)
             return dt.date().isoformat()
-        except Exception:
+        except ValueError:
             continue
     return raw
 
 
+def _find_date(text: str) -> re.Match | None:
+    for pattern in _DATE_RES:
+        match = pattern.search(text)
+        if match:
+            return match
+    return None
+
+
 def _classify_event_type(text: str) -> str:
+    # Substring checks on the lowercased line beat re.I alternations, which re can't fast-scan.
     lowered = text.lower()
-    if any(k in lowered for k in ["exam", "test", "assessment", "midsem", "endsem"]):
-        return "Exam"
-    if any(k in lowered for k in ["holiday", "vacation", "break"]):
-        return "Holiday"
-    if any(k in lowered for k in ["lecture", "seminar", "workshop"]):
-        return "Lecture"
+    for event_type, keywords in EVENT_TYPE_KEYWORDS.items():
+        if any(k in lowered for k in keywords):
+            return event_type
     return "Notice"
 
 
 def _extract_semester(text: str) -> str | None:
-    match = re.search(r"\b(sem(?:ester)?\s*[1-8])\b", text, flags=re.I)
+    match = _SEM_RE.search(text)
     return match.group(1) if match else None
 
 
 def _extract_department(text: str) -> str | None:
-    depts = ["computer", "it", "extc", "mechanical", "civil", "electronics", "electrical", "ai", "data science"]
     lowered = text.lower()
-    for dept in depts:
+    for dept in DEPARTMENTS:
         if dept in lowered:
             return dept.title()
     return None
 
 
 def parse_events_from_page(text: str, source_url: str, college_name: str) -> list[dict]:
-    lines = [line.strip() for line in re.split(r"[\n\.\|]+", text) if line.strip()]
     events: list[dict] = []
+    # Duplicate detection inside page; source_url is fixed per call, so name and date identify an event.
+    seen: set[tuple[str, str | None]] = set()
     source_lower = source_url.lower()
     is_calendar_source = any(k in source_lower for k in ["calendar", "holiday", "academic", ".pdf"])
 
-    for line in lines:
+    for raw_line in text.translate(_SPLIT_TABLE).split("\n"):
+        if len(raw_line) < 20:
+            continue
+        line = raw_line.strip()
         if len(line) < 20:
             continue
-        lowered = line.lower()
-
-        date_value = None
-        for pattern in DATE_PATTERNS:
-            match = re.search(pattern, line, flags=re.I)
-            if match:
-                date_value = _normalize_date(match.group(0))
-                break
 
-        has_event_keyword = any(k in lowered for k in ["exam", "notice", "calendar", "timetable", "academic", "holiday", "lecture", "assignment", "submission", "result", "orientation", "workshop", "vacation", "semester", "term"]) 
-        if not has_event_keyword and not (is_calendar_source and date_value):
+        # Cheap case-insensitive gates first; most lines never reach the classifiers.
+        # Without a keyword only calendar sources keep dated lines, so skip the date scan elsewhere.
+        has_keyword = _KEYWORD_RE.search(line) is not None
+        if not has_keyword and not is_calendar_source:
+            continue
+        match = _find_date(line)
+        if not has_keyword and not match:
             continue
 
+        date_value = _normalize_date(match.group(0)) if match else None
         event_name = line[:180]
+        key = (event_name.lower(), date_value)
+        if key in seen:
+            continue
+        seen.add(key)
+
         event_type = _classify_event_type(line)
         semester = _extract_semester(line)
         department = _extract_department(line)
@@ -88,13 +163,4 @@ def parse_events_from_page(text: str, source_url: str, college_name: str) -> lis
             }
         )
 
-    # duplicate detection inside page
-    unique = []
-    seen = set()
-    for event in events:
-        key = (event["event_name"].lower(), event["date"], event["source_url"])
-        if key in seen:
-            continue
-        seen.add(key)
-        unique.append(event)
-    return unique
+    return events
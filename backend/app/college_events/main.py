@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import re
 import time
 from pathlib import Path
 
@@ -19,47 +20,55 @@ logger = logging.getLogger(__name__)
 # ─── In-memory cache (college_name -> (timestamp, events)) ────────────
 _events_cache: dict[str, tuple[float, list[dict]]] = {}
 _CACHE_TTL_SECONDS = 600  # 10 minutes
+_FETCH_CONCURRENCY = 10
 
 
-def _scrape_events_sync(college) -> list[dict]:
-    """All synchronous web scraping happens here — runs in a thread."""
-    sitemap_url = college.sitemap_url or detect_sitemap(college.base_url)
+async def _scrape_events(college) -> list[dict]:
+    """Crawl a college site; blocking fetches run in threads, at most _FETCH_CONCURRENCY at a time."""
+    sitemap_url = college.sitemap_url or await asyncio.to_thread(detect_sitemap, college.base_url)
     if not sitemap_url:
         raise ValueError(f"No sitemap found for {college.name}")
 
-    urls = collect_relevant_urls(college.base_url, sitemap_url, college.keywords)
+    urls = await asyncio.to_thread(collect_relevant_urls, college.base_url, sitemap_url, college.keywords)
     urls = filter_urls(urls, college.keywords)
-    urls = list(dict.fromkeys([*college.seed_urls, *urls]))
+    urls = list(dict.fromkeys([*college.seed_urls, *urls]))[:80]
 
+    semaphore = asyncio.Semaphore(_FETCH_CONCURRENCY)
+
+    async def fetch(fetcher, url: str):
+        async with semaphore:
+            return await asyncio.to_thread(fetcher, url)
+
+    pages = await asyncio.gather(*(fetch(fetch_main_text_and_links, url) for url in urls), return_exceptions=True)
+
+    # An empty keyword list must match nothing, like any() over no keywords did.
+    keyword_re = re.compile("|".join(map(re.escape, college.keywords)) or r"(?!)", re.I)
     all_events: list[dict] = []
-    seen_sources: set[str] = set()
-    for url in urls[:80]:
-        if url in seen_sources:
+    seen_sources: set[str] = set(urls)
+    pdf_links: list[str] = []
+    for url, page in zip(urls, pages):
+        if isinstance(page, BaseException):
+            logger.warning("Skipping %s: %s", url, page)
+            continue
+        text, discovered_links = page
+        all_events.extend(parse_events_from_page(text, source_url=url, college_name=college.name))
+
+        for link in dict.fromkeys(discovered_links):
+            if link in seen_sources:
+                continue
+            if link[-4:].lower() != '.pdf':
+                continue
+            if not keyword_re.search(link):
+                continue
+            seen_sources.add(link)
+            pdf_links.append(link)
+
+    pdf_texts = await asyncio.gather(*(fetch(fetch_main_text, link) for link in pdf_links), return_exceptions=True)
+    for link, pdf_text in zip(pdf_links, pdf_texts):
+        if isinstance(pdf_text, BaseException):
+            logger.warning("Skipping linked PDF %s: %s", link, pdf_text)
             continue
-        seen_sources.add(url)
-        try:
-            text, discovered_links = fetch_main_text_and_links(url)
-            page_events = parse_events_from_page(text, source_url=url, college_name=college.name)
-            all_events.extend(page_events)
-
-            for link in discovered_links:
-                lowered = link.lower()
-                if link in seen_sources:
-                    continue
-                if not lowered.endswith('.pdf'):
-                    continue
-                if not any(k in lowered for k in college.keywords):
-                    continue
-                seen_sources.add(link)
-
-                try:
-                    pdf_text = fetch_main_text(link)
-                    pdf_events = parse_events_from_page(pdf_text, source_url=link, college_name=college.name)
-                    all_events.extend(pdf_events)
-                except Exception as exc:
-                    logger.warning("Skipping linked PDF %s: %s", link, exc)
-        except Exception as exc:
-            logger.warning("Skipping %s: %s", url, exc)
+        all_events.extend(parse_events_from_page(pdf_text, source_url=link, college_name=college.name))
 
     return all_events
 
@@ -78,8 +87,7 @@ async def fetch_events_for_college(college_name: str, db: AsyncSession) -> list[
     if college is None:
         raise ValueError(f"College '{college_name}' not found in config")
 
-    # Run blocking scraping in a thread so we don't block the event loop
-    all_events = await asyncio.to_thread(_scrape_events_sync, college)
+    all_events = await _scrape_events(college)
 
     fallback_file = Path("./uploads/college_events_fallback.json")
     saved = await save_events_with_fallback(db, all_events, fallback_file)
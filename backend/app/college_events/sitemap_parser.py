@@ -1,23 +1,28 @@
 from __future__ import annotations
 
+import io
 import logging
-import time
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin
-from xml.etree import ElementTree as ET
 
 import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+from lxml import etree
+
+from .throttle import cached_session, is_cached, wait_for_host
 
 logger = logging.getLogger(__name__)
 
+_SITEMAP_FETCH_WORKERS = 8
+
 
-def _session() -> requests.Session:
-    session = requests.Session()
-    retry = Retry(total=3, backoff_factor=0.7, status_forcelist=(429, 500, 502, 503, 504), allowed_methods=("GET",))
-    session.mount("http://", HTTPAdapter(max_retries=retry))
-    session.mount("https://", HTTPAdapter(max_retries=retry))
-    return session
+def _is_sitemap(session: requests.Session, candidate: str, timeout: int) -> bool:
+    try:
+        resp = session.head(candidate, timeout=timeout, allow_redirects=True)
+        if resp.status_code in (405, 501):
+            resp = session.get(candidate, timeout=timeout)
+    except Exception:
+        return False
+    return resp.status_code == 200 and "xml" in resp.headers.get("content-type", "")
 
 
 def detect_sitemap(base_url: str, timeout: int = 20) -> str | None:
@@ -26,50 +31,56 @@ def detect_sitemap(base_url: str, timeout: int = 20) -> str | None:
         f"{base_url}/wp-sitemap.xml",
         f"{base_url}/sitemap_index.xml",
     ]
-    session = _session()
-    for candidate in candidates:
-        try:
-            resp = session.get(candidate, timeout=timeout)
-            if resp.status_code == 200 and "xml" in resp.headers.get("content-type", ""):
-                return candidate
-        except Exception:
-            continue
+    session = cached_session()
+    # HEAD all candidates at once, but still prefer them in the order listed.
+    with ThreadPoolExecutor(max_workers=len(candidates)) as executor:
+        found = list(executor.map(lambda candidate: _is_sitemap(session, candidate, timeout), candidates))
+    for candidate, is_sitemap in zip(candidates, found):
+        if is_sitemap:
+            return candidate
     return None
 
 
-def _parse_xml_urls(xml_text: str) -> list[str]:
-    root = ET.fromstring(xml_text.encode("utf-8", errors="ignore"))
+def _parse_xml_urls(xml_bytes: bytes) -> list[str]:
     urls = []
-    for element in root.iter():
-        if element.tag.endswith("loc") and element.text:
+    # Stream <loc> elements and clear them as we go so large sitemap indexes never build a full tree.
+    for _, element in etree.iterparse(io.BytesIO(xml_bytes), events=("end",), tag="{*}loc", recover=True):
+        if element.text:
             urls.append(element.text.strip())
+        element.clear(keep_tail=True)
     return urls
 
 
 def collect_relevant_urls(base_url: str, sitemap_url: str, keywords: list[str], timeout: int = 20, rate_limit_seconds: float = 0.25) -> list[str]:
-    session = _session()
+    session = cached_session()
 
     index_resp = session.get(sitemap_url, timeout=timeout)
     index_resp.raise_for_status()
-    index_locs = _parse_xml_urls(index_resp.text)
+    index_locs = _parse_xml_urls(index_resp.content)
 
     sitemap_files = [u for u in index_locs if u.endswith(".xml")]
     if not sitemap_files:
         sitemap_files = [sitemap_url]
 
-    target_urls: list[str] = []
-    seen = set()
-
-    for sitemap_file in sitemap_files:
-        time.sleep(rate_limit_seconds)
+    def fetch_sitemap(sitemap_file: str) -> list[str]:
+        if not is_cached(session, sitemap_file):
+            wait_for_host(sitemap_file, rate_limit_seconds)
         try:
             resp = session.get(sitemap_file, timeout=timeout)
             resp.raise_for_status()
-            urls = _parse_xml_urls(resp.text)
+            return _parse_xml_urls(resp.content)
         except Exception as exc:
             logger.warning("Failed sitemap %s: %s", sitemap_file, exc)
-            continue
+            return []
+
+    # Sub-sitemaps are fetched concurrently; map() keeps results in sitemap order.
+    with ThreadPoolExecutor(max_workers=_SITEMAP_FETCH_WORKERS) as executor:
+        sitemap_urls = list(executor.map(fetch_sitemap, sitemap_files))
+
+    target_urls: list[str] = []
+    seen = set()
 
+    for urls in sitemap_urls:
         for url in urls:
             absolute = url if url.startswith("http") else urljoin(base_url + "/", url)
             lowered = absolute.lower()
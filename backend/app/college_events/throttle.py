@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
+from urllib3.util.retry import Retry
+
+# One on-disk cache shared by every crawl stage; is_cached() only helps if sitemap and
+# page fetches read the same file with the same expiry.
+_HTTP_CACHE_NAME = "./uploads/college_events_cache"
+
+
+class _HostThrottle:
+    """Spaces out request start times to one host.
+
+    Each caller passes its own `min_interval` and waits until that long after the
+    previous request to the host started, so crawl stages with different rate limits
+    can share a host without one stage's interval overriding the other's. Unlike a
+    fixed sleep before every request, a caller only waits when the previous request
+    started less than `min_interval` ago.
+    """
+
+    def __init__(self):
+        self._last_start = float("-inf")
+        self._lock = threading.Lock()
+
+    def wait(self, min_interval: float) -> None:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._last_start + min_interval)
+            self._last_start = start
+        delay = start - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+_throttles: dict[str, _HostThrottle] = {}
+_throttles_lock = threading.Lock()
+
+
+def wait_for_host(url: str, min_interval: float) -> None:
+    """Block until a request to `url`'s host is allowed under the per-host rate limit."""
+    if min_interval <= 0:
+        return
+    host = urlparse(url).netloc.lower()
+    with _throttles_lock:
+        throttle = _throttles.get(host)
+        if throttle is None:
+            throttle = _throttles[host] = _HostThrottle()
+    throttle.wait(min_interval)
+
+
+def is_cached(session: requests.Session, url: str) -> bool:
+    """True when `session` (a requests-cache CachedSession) answers a GET of `url` from
+    disk. Expired entries don't count: they are revalidated over the network."""
+    cache = getattr(session, "cache", None)
+    if cache is None:
+        return False
+    response = cache.get_response(cache.create_key(requests.Request("GET", url)))
+    return response is not None and not response.is_expired
+
+
+def cached_session() -> requests.Session:
+    # Responses persist across runs; expired entries are revalidated with ETag/Last-Modified.
+    session = CachedSession(_HTTP_CACHE_NAME, backend="sqlite", expire_after=3600, stale_if_error=True)
+    retry = Retry(total=3, backoff_factor=0.7, status_forcelist=(429, 500, 502, 503, 504), allowed_methods=("GET",))
+    session.mount("http://", HTTPAdapter(max_retries=retry))
+    session.mount("https://", HTTPAdapter(max_retries=retry))
+    return session
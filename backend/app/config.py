@@ -21,6 +21,7 @@ class Settings(BaseSettings):
     # Ollama (local AI)
     OLLAMA_BASE_URL: str = "http://localhost:11434"
     OLLAMA_MODEL: str = "qwen2.5:7b"
+    OLLAMA_ESTIMATE_TIMEOUT_SECONDS: float = 20.0  # fall back to the heuristic after this
 
     # Google OAuth / Classroom
     GOOGLE_CLIENT_ID: str | None = None
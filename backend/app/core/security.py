@@ -1,11 +1,19 @@
-from datetime import datetime, timedelta
+import time
+from datetime import timedelta
 from typing import Any
-from jose import JWTError, jwt
+import jwt
 from passlib.context import CryptContext
 from app.config import settings
 
-# Password hashing context (PBKDF2 SHA256)
-pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
+# Password hashing context: new hashes use Argon2 (argon2-cffi, native code);
+# existing PBKDF2-SHA256 hashes still verify.
+pwd_context = CryptContext(
+    schemes=["argon2", "pbkdf2_sha256"],
+    deprecated="auto",
+    argon2__time_cost=2,
+    argon2__memory_cost=65536,
+    argon2__parallelism=1,
+)
 
 
 # ─── Password ────────────────────────────────────────────────
@@ -22,15 +30,17 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 # ─── JWT ─────────────────────────────────────────────────────
 
+# Built once; decode runs on every authenticated request.
+_JWT_DECODE_KWARGS = {"key": settings.SECRET_KEY, "algorithms": [settings.ALGORITHM]}
+
 def create_access_token(subject: Any, expires_delta: timedelta | None = None) -> str:
     """
     Create a JWT access token.
     subject = user ID (str) stored in 'sub' claim.
     """
-    expire = datetime.utcnow() + (
-        expires_delta or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    )
-    payload = {"sub": str(subject), "exp": expire, "iat": datetime.utcnow()}
+    lifetime = expires_delta or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    now = int(time.time())  # JWT exp/iat are Unix seconds
+    payload = {"sub": str(subject), "exp": now + int(lifetime.total_seconds()), "iat": now}
     return jwt.encode(payload, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
 
 
@@ -40,7 +50,7 @@ def decode_access_token(token: str) -> dict | None:
     Returns the payload dict or None if invalid/expired.
     """
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = jwt.decode(token, **_JWT_DECODE_KWARGS)
         return payload
-    except JWTError:
+    except jwt.PyJWTError:
         return None
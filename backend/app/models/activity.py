@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime, date, time
-from sqlalchemy import String, Text, Date, Time, DateTime, ForeignKey, Boolean, Uuid
+from sqlalchemy import String, Text, Date, Time, DateTime, ForeignKey, Boolean, Uuid, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.database import Base
 
@@ -26,6 +26,10 @@ class Activity(Base):
     created_at:  Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
     updated_at:  Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    __table_args__ = (
+        Index("ix_activity_user_date", "user_id", "activity_date"),
+    )
+
     # Relationships
     user   = relationship("User", back_populates="activities")
     alerts = relationship("Alert", back_populates="activity", foreign_keys="Alert.related_activity_id")
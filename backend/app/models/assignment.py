@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime, date
-from sqlalchemy import String, Text, Date, DateTime, ForeignKey, Enum, Uuid, JSON
+from sqlalchemy import String, Text, Date, DateTime, ForeignKey, Enum, Uuid, JSON, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.database import Base
 import enum
@@ -45,6 +45,11 @@ class Assignment(Base):
     created_at:          Mapped[datetime]       = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
     updated_at:          Mapped[datetime]       = mapped_column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    __table_args__ = (
+        # A user's open assignments within a deadline window
+        Index("ix_assign_user_deadline", "user_id", "status", "deadline"),
+    )
+
     # Relationships
     user     = relationship("User", back_populates="assignments")
     document = relationship("Document", foreign_keys=[source_document_id])
@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime, date
-from sqlalchemy import String, Text, DateTime, ForeignKey, Date, Boolean, Enum, Uuid, JSON
+from sqlalchemy import String, Text, DateTime, ForeignKey, Date, Boolean, Enum, Uuid, JSON, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.database import Base
 import enum
@@ -74,6 +74,16 @@ class Alert(Base):
 
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
 
+    __table_args__ = (
+        # Unread alerts for a user, newest first
+        Index("ix_alerts_user_unread", "user_id", "is_read", "created_at"),
+        # Duplicate checks in alert_service: unread alerts of one type for a user
+        Index("ix_alerts_user_type_unread", "user_id", "alert_type", "is_read"),
+        # ON DELETE SET NULL lookups when an assignment or subject is removed
+        Index("ix_alerts_related_assignment", "related_assignment_id"),
+        Index("ix_alerts_related_subject", "related_subject_id"),
+    )
+
     # Relationships
     user       = relationship("User", back_populates="alerts")
     assignment = relationship("Assignment", back_populates="alerts", foreign_keys=[related_assignment_id])
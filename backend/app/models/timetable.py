@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import String, Integer, Time, DateTime, ForeignKey, UniqueConstraint, Text, Boolean, JSON, Uuid
+from sqlalchemy import String, Integer, Time, DateTime, ForeignKey, Index, UniqueConstraint, Text, Boolean, JSON, Uuid
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.database import Base
 
@@ -21,6 +21,8 @@ class TimetableEntry(Base):
 
     __table_args__ = (
         UniqueConstraint("user_id", "subject_id", "day_of_week", "start_time", name="uq_timetable_entry"),
+        # Today's classes / check-in / unmarked: filter on user+day+active, ordered by start
+        Index("ix_tt_user_day_active_start", "user_id", "day_of_week", "is_active", "start_time"),
     )
 
     user = relationship("User", back_populates="timetable_entries")
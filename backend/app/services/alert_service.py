@@ -14,25 +14,34 @@ This is called:
 from uuid import UUID
 from datetime import date, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import Row, select, and_
 from app.models.document_alert import Alert, AlertType, AlertSeverity
 from app.models.assignment import Assignment, AssignmentStatus
 from app.models.activity import Activity
-from app.services.attendance_service import get_attendance_summary
+from app.services.attendance_service import get_low_attendance_with_needed
 
 
 async def generate_alerts(user_id: UUID, db: AsyncSession) -> list[Alert]:
     """Run all prediction rules and save new alerts to DB."""
-    new_alerts: list[Alert] = []
+    # The rules are pure functions over three prefetched inputs. The queries run in
+    # turn on the caller's session so they see its uncommitted changes.
+    today = date.today()
+    upcoming = await _fetch_upcoming(user_id, today, db)
+    unread = await _load_unread_index(user_id, db)
+    low_subjects = await get_low_attendance_with_needed(user_id, db)
+    tomorrow = today + timedelta(days=1)
+    due_tomorrow = [a for a in upcoming if a.deadline == tomorrow]
 
-    new_alerts += await _check_overload(user_id, db)
-    new_alerts += await _check_attendance(user_id, db)
-    new_alerts += await _check_deadline_soon(user_id, db)
+    new_alerts: list[Alert] = [
+        *_check_overload(user_id, upcoming, today, unread),
+        *_check_attendance(user_id, low_subjects, unread),
+        *_check_deadline_soon(user_id, due_tomorrow, unread),
+    ]
 
     # Persist only alerts not already saved (avoid duplicates)
-    for alert in new_alerts:
-        db.add(alert)
-    await db.flush()
+    if new_alerts:
+        db.add_all(new_alerts)
+        await db.flush()
     return new_alerts
 
 
@@ -57,33 +66,40 @@ async def mark_alert_read(user_id: UUID, alert_id: UUID, db: AsyncSession) -> No
         await db.flush()
 
 
-# ─── Rule 1: Overload ─────────────────────────────────────────
-
-async def _check_overload(user_id: UUID, db: AsyncSession) -> list[Alert]:
-    today  = date.today()
-    cutoff = today + timedelta(days=7)
-
+async def _fetch_upcoming(user_id: UUID, today: date, db: AsyncSession) -> list[Row]:
+    """
+    Open assignments due in the next 7 days, soonest first.
+    Only the columns the rules read — skips hydrating description/ai_metadata into ORM objects.
+    """
     result = await db.execute(
-        select(Assignment).where(
+        select(
+            Assignment.id, Assignment.title, Assignment.subject, Assignment.deadline
+        ).where(
             and_(
                 Assignment.user_id == user_id,
                 Assignment.deadline >= today,
-                Assignment.deadline <= cutoff,
+                Assignment.deadline <= today + timedelta(days=7),
                 Assignment.status != AssignmentStatus.completed.value,
             )
         ).order_by(Assignment.deadline)
     )
-    upcoming = result.scalars().all()
+    return list(result.all())
+
+
+# ─── Rule 1: Overload ─────────────────────────────────────────
+
+def _check_overload(
+    user_id: UUID, upcoming: list[Row], today: date, unread: dict
+) -> list[Alert]:
+    cutoff = today + timedelta(days=7)
 
     if len(upcoming) < 3:
         return []
 
     # Avoid duplicate alert for same window
-    existing = await _alert_exists(user_id, AlertType.overload, db)
-    if existing:
+    if unread["overload"]:
         return []
 
-    subjects = list({a.subject or "Unknown" for a in upcoming})
     return [Alert(
         user_id=user_id,
         alert_type=AlertType.overload,
@@ -101,26 +117,16 @@ async def _check_overload(user_id: UUID, db: AsyncSession) -> list[Alert]:
 
 # ─── Rule 2: Low Attendance ───────────────────────────────────
 
-async def _check_attendance(user_id: UUID, db: AsyncSession) -> list[Alert]:
-    summaries = await get_attendance_summary(user_id, db)
+def _check_attendance(user_id: UUID, low_subjects: list[dict], unread: dict) -> list[Alert]:
     alerts = []
 
-    for s in summaries:
-        if not s.below_threshold:
-            continue
-
-        existing = await _alert_exists(
-            user_id, AlertType.attendance_low, db, subject_id=s.subject_id
-        )
-        if existing:
+    for s in low_subjects:
+        if s["subject_id"] in unread["subjects"]:
             continue
 
         # How many more classes to attend to reach 75%?
-        safe_threshold = 0.75
-        # solve: (present + x) / (total + x) >= 0.75
-        if s.total_classes > 0:
-            x = max(0, int((safe_threshold * s.total_classes - s.present_count) / (1 - safe_threshold)))
-            classes_needed_msg = f" You need to attend {x} consecutive classes to recover."
+        if s["total_classes"] > 0:
+            classes_needed_msg = f" You need to attend {s['classes_needed']} consecutive classes to recover."
         else:
             classes_needed_msg = ""
 
@@ -128,12 +134,12 @@ async def _check_attendance(user_id: UUID, db: AsyncSession) -> list[Alert]:
             user_id=user_id,
             alert_type=AlertType.attendance_low,
             severity=AlertSeverity.critical,
-            title=f"Low Attendance: {s.subject_name}",
+            title=f"Low Attendance: {s['subject_name']}",
             message=(
-                f"Your attendance in {s.subject_name} is {s.attendance_percentage}%, "
+                f"Your attendance in {s['subject_name']} is {s['attendance_percentage']}%, "
                 f"which is below the required 75%.{classes_needed_msg}"
             ),
-            related_subject_id=s.subject_id,
+            related_subject_id=s["subject_id"],
         ))
 
     return alerts
@@ -141,27 +147,11 @@ async def _check_attendance(user_id: UUID, db: AsyncSession) -> list[Alert]:
 
 # ─── Rule 3: Deadline in 24 hours ─────────────────────────────
 
-async def _check_deadline_soon(user_id: UUID, db: AsyncSession) -> list[Alert]:
-    today    = date.today()
-    tomorrow = today + timedelta(days=1)
-
-    result = await db.execute(
-        select(Assignment).where(
-            and_(
-                Assignment.user_id == user_id,
-                Assignment.deadline == tomorrow,
-                Assignment.status != AssignmentStatus.completed.value,
-            )
-        )
-    )
-    due_tomorrow = result.scalars().all()
+def _check_deadline_soon(user_id: UUID, due_tomorrow: list[Row], unread: dict) -> list[Alert]:
     alerts = []
 
     for assignment in due_tomorrow:
-        existing = await _alert_exists(
-            user_id, AlertType.deadline_soon, db, assignment_id=assignment.id
-        )
-        if existing:
+        if assignment.id in unread["assignments"]:
             continue
 
         alerts.append(Alert(
@@ -174,7 +164,7 @@ async def _check_deadline_soon(user_id: UUID, db: AsyncSession) -> list[Alert]:
                 f"is due tomorrow. Mark it complete once done."
             ),
             related_assignment_id=assignment.id,
-            expires_at=tomorrow,
+            expires_at=assignment.deadline,
         ))
 
     return alerts
@@ -182,25 +172,29 @@ async def _check_deadline_soon(user_id: UUID, db: AsyncSession) -> list[Alert]:
 
 # ─── Helper: avoid duplicate alerts ───────────────────────────
 
-async def _alert_exists(
-    user_id: UUID,
-    alert_type: AlertType,
-    db: AsyncSession,
-    subject_id: UUID | None = None,
-    assignment_id: UUID | None = None,
-) -> bool:
-    from datetime import datetime
-    query = select(Alert).where(
-        and_(
-            Alert.user_id == user_id,
-            Alert.alert_type == alert_type,
-            Alert.is_read == False,
+async def _load_unread_index(user_id: UUID, db: AsyncSession) -> dict:
+    """
+    Every unread alert the rules could duplicate, in one query:
+    {"overload": bool, "subjects": set[UUID], "assignments": set[UUID]}.
+    """
+    result = await db.execute(
+        select(Alert.alert_type, Alert.related_subject_id, Alert.related_assignment_id).where(
+            and_(
+                Alert.user_id == user_id,
+                Alert.is_read == False,
+                Alert.alert_type.in_(
+                    [AlertType.overload, AlertType.attendance_low, AlertType.deadline_soon]
+                ),
+            )
         )
     )
-    if subject_id:
-        query = query.where(Alert.related_subject_id == subject_id)
-    if assignment_id:
-        query = query.where(Alert.related_assignment_id == assignment_id)
 
-    result = await db.execute(query)
-    return result.scalar_one_or_none() is not None
+    unread = {"overload": False, "subjects": set(), "assignments": set()}
+    for alert_type, subject_id, assignment_id in result.all():
+        if alert_type == AlertType.overload:
+            unread["overload"] = True
+        elif alert_type == AlertType.attendance_low:
+            unread["subjects"].add(subject_id)
+        else:
+            unread["assignments"].add(assignment_id)
+    return unread
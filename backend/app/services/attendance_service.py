@@ -3,7 +3,7 @@ from datetime import date, timedelta
 from typing import Dict, List
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func
+from sqlalchemy import select, and_, or_, func, case
 from app.models.attendance import Subject, AttendanceRecord, AttendanceStatus
 from app.schemas.schemas import SubjectCreate, SubjectUpdate, AttendanceMarkRequest, AttendanceSummaryOut
 
@@ -157,6 +157,54 @@ async def get_attendance_summary(
     return summaries
 
 
+async def get_low_attendance_with_needed(user_id: UUID, db: AsyncSession) -> List[Dict]:
+    """
+    Subjects below 75% attendance, aggregated in one query.
+    Late counts as present, as in get_attendance_summary. `classes_needed` is the number of
+    consecutive present marks to get back to 75%: (present + x) / (total + x) >= 0.75
+    gives x >= 3*total - 4*present, which is exact integer arithmetic in SQL.
+    """
+    total = func.count(AttendanceRecord.id)
+    present = func.coalesce(
+        func.sum(
+            case(
+                (AttendanceRecord.status.in_([AttendanceStatus.present, AttendanceStatus.late]), 1),
+                else_=0,
+            )
+        ),
+        0,
+    )
+    result = await db.execute(
+        select(
+            Subject.id,
+            Subject.name,
+            total.label("total_classes"),
+            present.label("present_count"),
+            (3 * total - 4 * present).label("classes_needed"),
+        )
+        .outerjoin(
+            AttendanceRecord,
+            and_(AttendanceRecord.subject_id == Subject.id, AttendanceRecord.user_id == user_id),
+        )
+        .where(Subject.user_id == user_id)
+        .group_by(Subject.id, Subject.name)
+        .having(or_(total == 0, 4 * present < 3 * total))
+    )
+
+    return [
+        {
+            "subject_id": row.id,
+            "subject_name": row.name,
+            "total_classes": row.total_classes,
+            "attendance_percentage": (
+                round((row.present_count / row.total_classes) * 100, 2) if row.total_classes > 0 else 0.0
+            ),
+            "classes_needed": row.classes_needed,
+        }
+        for row in result.all()
+    ]
+
+
 async def project_attendance(
     user_id: UUID, subject_id: UUID, db: AsyncSession,
     total_remaining: int = 10  # assume 10 more classes in semester
@@ -6,6 +6,7 @@ import json
 import logging
 from typing import Dict, Any
 import httpx
+import orjson
 
 from app.config import settings
 
@@ -59,7 +60,7 @@ class OllamaClient:
             cleaned = re.sub(r"```$", "", cleaned).strip()
         
         try:
-            return json.loads(cleaned)
+            return orjson.loads(cleaned)
         except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON from Ollama: {e}\nResponse: {cleaned[:500]}")
             return None
@@ -103,7 +104,7 @@ class OllamaClient:
             cleaned = re.sub(r"```$", "", cleaned).strip()
         
         try:
-            return json.loads(cleaned)
+            return orjson.loads(cleaned)
         except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON from Ollama: {e}\nResponse: {cleaned[:500]}")
             return None
@@ -269,12 +269,8 @@ class OllamaTimetableExtractor:
     async def _extract_vision(self, file_path: str) -> Dict:
         """Extract timetable using Ollama vision API (llava / bakllava)."""
         ext = os.path.splitext(file_path)[1].lower()
-        image = await anyio.to_thread.run_sync(self._load_image, file_path, ext)
-
-        import io as _io
-        buffer = _io.BytesIO()
-        image.save(buffer, format="PNG")
-        image_base64 = base64.b64encode(buffer.getvalue()).decode()
+        # PNG encoding a full-page scan is CPU-heavy; keep it off the event loop too.
+        image_base64 = await anyio.to_thread.run_sync(self._load_image_base64, file_path, ext)
 
         import httpx
         timeout = httpx.Timeout(connect=5.0, read=180.0, write=30.0, pool=5.0)
@@ -735,6 +731,13 @@ class OllamaTimetableExtractor:
 
         return Image.open(file_path)
 
+    def _load_image_base64(self, file_path: str, ext: str) -> str:
+        import io as _io
+        image = self._load_image(file_path, ext)
+        buffer = _io.BytesIO()
+        image.save(buffer, format="PNG")
+        return base64.b64encode(buffer.getvalue()).decode()
+
     def _parse_json(self, result_text: str) -> Dict:
         cleaned = result_text.replace("```json", "").replace("```", "").strip()
         try:
@@ -1,5 +1,10 @@
+import asyncio
+import copy
+import hashlib
 import json
 import re
+import time
+from collections import OrderedDict
 from typing import Dict, Tuple
 
 import anyio
@@ -7,6 +12,45 @@ import anyio
 from app.config import settings
 from app.services.ollama_client import ollama_client
 
+_WORD_RE = re.compile(r"\b\w+\b")
+
+# Checked in order; the first match wins. Searched against lowercased text.
+_TASK_TYPE_PATTERNS = [
+    (task_type, re.compile(pattern))
+    for task_type, pattern in {
+        "programming": r"write.*code|implement|program|function|algorithm|debug",
+        "essay": r"essay|write.*paper|composition|argue|thesis",
+        "research": r"research|investigate|literature review|sources",
+        "problem_set": r"solve|problems?\s*\d+|calculate|find the",
+        "lab": r"lab|experiment|laboratory|procedure",
+        "presentation": r"present|slide|powerpoint|speech",
+        "reading": r"read.*chapter|reading assignment",
+        "quiz": r"quiz|short answer",
+        "exam": r"exam|test|midterm|final",
+        "project": r"project|capstone|build",
+    }.items()
+]
+
+_Q_PAT1 = re.compile(r"(?:problem|question|q)\s*\d+")
+_Q_PAT2 = re.compile(r"(\d+)\s*(?:questions?|problems?)")
+
+# One alternation per check so the text is scanned once rather than once per pattern.
+_MATH_RE = re.compile(
+    r"\$.*?\$"
+    r"|\\[a-z]+\{"
+    r"|[∫∑∏√±×÷≠≈≤≥∞]"
+    r"|\b(?:theorem|lemma|proof|equation|formula)\b",
+    re.IGNORECASE,
+)
+
+_CODE_RE = re.compile(
+    r"```"
+    r"|def |function |class |import |require\("
+    r"|for\s*\(|while\s*\(|if\s*\("
+    r"|public |private |void |int |string ",
+    re.IGNORECASE,
+)
+
 
 class AssignmentTimeEstimator:
     SIMPLE_KEYWORDS = [
@@ -42,13 +86,14 @@ class AssignmentTimeEstimator:
 
     def estimate(self, text: str, task_type: str | None = None) -> Dict:
         safe_text = text or ""
+        text_lower = safe_text.lower()
         word_count = self._count_words(safe_text)
         reading_time = self._estimate_reading_time(word_count)
 
-        complexity_level, complexity_score = self._analyze_complexity(safe_text)
+        complexity_level, complexity_score = self._analyze_complexity(text_lower)
 
-        resolved_task_type = task_type or self._detect_task_type(safe_text)
-        question_count = self._count_questions(safe_text)
+        resolved_task_type = task_type or self._detect_task_type(text_lower)
+        question_count = self._count_questions(text_lower)
 
         has_math = self._has_mathematical_content(safe_text)
         has_code = self._has_code_content(safe_text)
@@ -93,16 +138,14 @@ class AssignmentTimeEstimator:
         }
 
     def _count_words(self, text: str) -> int:
-        words = re.findall(r"\b\w+\b", text.lower())
-        return len(words)
+        return len(_WORD_RE.findall(text))
 
     def _estimate_reading_time(self, word_count: int) -> int:
         if word_count < 100:
             return 5
         return max(5, int(word_count / 200))
 
-    def _analyze_complexity(self, text: str) -> Tuple[str, float]:
-        text_lower = text.lower()
+    def _analyze_complexity(self, text_lower: str) -> Tuple[str, float]:
         simple_count = sum(1 for kw in self.SIMPLE_KEYWORDS if kw in text_lower)
         medium_count = sum(1 for kw in self.MEDIUM_KEYWORDS if kw in text_lower)
         complex_count = sum(1 for kw in self.COMPLEX_KEYWORDS if kw in text_lower)
@@ -118,30 +161,16 @@ class AssignmentTimeEstimator:
             return "medium", score
         return "complex", score
 
-    def _detect_task_type(self, text: str) -> str:
-        text_lower = text.lower()
-        patterns = {
-            "programming": r"write.*code|implement|program|function|algorithm|debug",
-            "essay": r"essay|write.*paper|composition|argue|thesis",
-            "research": r"research|investigate|literature review|sources",
-            "problem_set": r"solve|problems?\s*\d+|calculate|find the",
-            "lab": r"lab|experiment|laboratory|procedure",
-            "presentation": r"present|slide|powerpoint|speech",
-            "reading": r"read.*chapter|reading assignment",
-            "quiz": r"quiz|short answer",
-            "exam": r"exam|test|midterm|final",
-            "project": r"project|capstone|build",
-        }
-
-        for detected_type, pattern in patterns.items():
-            if re.search(pattern, text_lower):
+    def _detect_task_type(self, text_lower: str) -> str:
+        for detected_type, pattern in _TASK_TYPE_PATTERNS:
+            if pattern.search(text_lower):
                 return detected_type
         return "default"
 
-    def _count_questions(self, text: str) -> int:
-        pattern1 = re.findall(r"(?:problem|question|q)\s*\d+", text.lower())
-        pattern2 = re.findall(r"(\d+)\s*(?:questions?|problems?)", text.lower())
-        pattern3 = text.count("?")
+    def _count_questions(self, text_lower: str) -> int:
+        pattern1 = _Q_PAT1.findall(text_lower)
+        pattern2 = _Q_PAT2.findall(text_lower)
+        pattern3 = text_lower.count("?")
 
         count1 = len(pattern1)
         count2 = int(pattern2[0]) if pattern2 else 0
@@ -150,28 +179,10 @@ class AssignmentTimeEstimator:
         return max(count1, count2, min(count3, 20))
 
     def _has_mathematical_content(self, text: str) -> bool:
-        math_patterns = [
-            r"\$.*?\$",
-            r"\\[a-z]+\{",
-            r"[∫∑∏√±×÷≠≈≤≥∞]",
-            r"\b(?:theorem|lemma|proof|equation|formula)\b",
-        ]
-        for pattern in math_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return True
-        return False
+        return _MATH_RE.search(text) is not None
 
     def _has_code_content(self, text: str) -> bool:
-        code_patterns = [
-            r"```",
-            r"def |function |class |import |require\(",
-            r"for\s*\(|while\s*\(|if\s*\(",
-            r"public |private |void |int |string ",
-        ]
-        for pattern in code_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return True
-        return False
+        return _CODE_RE.search(text) is not None
 
     def _calculate_confidence(
         self,
@@ -233,20 +244,98 @@ class AssignmentTimeEstimator:
         }
 
 
+_MIN_MODEL_CHARS = 300
+_MIN_MODEL_WORDS = 50
+
+
 async def estimate_assignment_time(text: str, task_type: str | None = None) -> Dict:
     safe_text = (text or "").strip()
     if not safe_text:
         estimator = AssignmentTimeEstimator()
         return estimator.estimate("", task_type)
 
+    # Short or non-textual inputs (e.g. a bare assignment title) aren't worth a model
+    # round trip: the heuristic is as good there and answers in well under a millisecond.
+    if (
+        len(safe_text) < _MIN_MODEL_CHARS
+        or len(_WORD_RE.findall(safe_text)) < _MIN_MODEL_WORDS
+        or not any(ch.isalpha() for ch in safe_text)
+    ):
+        return _heuristic_estimate(safe_text, task_type)
+
     # Try Ollama AI estimation first
-    ollama_result = await _estimate_with_ollama(safe_text, task_type)
+    ollama_result = await _estimate_with_ollama_shared(safe_text, task_type)
     if ollama_result is not None:
         return ollama_result
 
     # Fall back to heuristic estimator
-    estimator = AssignmentTimeEstimator()
-    return estimator.estimate(safe_text, task_type)
+    return _heuristic_estimate(safe_text, task_type)
+
+
+# The heuristic is deterministic in (text, task_type), so repeat estimates of the same
+# text are served from a small LRU. Keys hold a digest rather than the text itself so
+# cached entries don't pin large document bodies in memory.
+_HEURISTIC_CACHE_SIZE = 1024
+_heuristic_cache: OrderedDict[tuple[bytes, str | None], Dict] = OrderedDict()
+
+
+def _estimate_key(text: str, task_type: str | None) -> tuple[bytes, str | None]:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest(), task_type
+
+
+def _heuristic_estimate(text: str, task_type: str | None = None) -> Dict:
+    key = _estimate_key(text, task_type)
+    cached = _heuristic_cache.get(key)
+    if cached is None:
+        cached = AssignmentTimeEstimator().estimate(text, task_type)
+        _heuristic_cache[key] = cached
+        if len(_heuristic_cache) > _HEURISTIC_CACHE_SIZE:
+            _heuristic_cache.popitem(last=False)
+    else:
+        _heuristic_cache.move_to_end(key)
+    # Callers store the result on ORM rows; hand out a copy so the cached entry stays intact.
+    return copy.deepcopy(cached)
+
+
+# Successful Ollama estimates, by estimate key plus model name so switching
+# OLLAMA_MODEL doesn't serve answers from the old model. Failed calls aren't cached,
+# so estimates recover as soon as Ollama is reachable again.
+_ollama_cache: OrderedDict[tuple, tuple[float, Dict]] = OrderedDict()
+_OLLAMA_CACHE_SIZE = 1024
+_OLLAMA_CACHE_TTL_SECONDS = 3600
+
+# Ollama calls currently in flight, by the same key. Concurrent requests for the same
+# text (e.g. a class-wide post estimated by many students at once) await one call.
+_ollama_inflight: dict[tuple, asyncio.Task] = {}
+
+
+async def _estimate_with_ollama_shared(text: str, task_type: str | None = None) -> Dict | None:
+    key = (*_estimate_key(text, task_type), settings.OLLAMA_MODEL)
+    cached = _ollama_cache.get(key)
+    if cached:
+        cached_time, cached_result = cached
+        if time.monotonic() - cached_time < _OLLAMA_CACHE_TTL_SECONDS:
+            _ollama_cache.move_to_end(key)
+            return copy.deepcopy(cached_result)
+        del _ollama_cache[key]
+
+    task = _ollama_inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_estimate_with_ollama(text, task_type))
+        _ollama_inflight[key] = task
+        task.add_done_callback(lambda done: _finish_ollama_call(key, done))
+    # Shield so one caller being cancelled doesn't cancel the call for everyone else.
+    result = await asyncio.shield(task)
+    return copy.deepcopy(result) if result is not None else None
+
+
+def _finish_ollama_call(key: tuple, task: asyncio.Task) -> None:
+    _ollama_inflight.pop(key, None)
+    if task.cancelled() or task.exception() is not None or task.result() is None:
+        return
+    _ollama_cache[key] = (time.monotonic(), task.result())
+    if len(_ollama_cache) > _OLLAMA_CACHE_SIZE:
+        _ollama_cache.popitem(last=False)
 
 
 async def _estimate_with_ollama(text: str, task_type: str | None = None) -> Dict | None:
@@ -264,7 +353,10 @@ async def _estimate_with_ollama(text: str, task_type: str | None = None) -> Dict
             f"Assignment text:\n{text[:12000]}"
         )
 
-        parsed = await ollama_client.generate_json(prompt)
+        # Bound the whole call so a stalled model falls through to the heuristic instead
+        # of holding every coalesced caller for the client's 120 s read timeout.
+        with anyio.fail_after(settings.OLLAMA_ESTIMATE_TIMEOUT_SECONDS):
+            parsed = await ollama_client.generate_json(prompt)
         if parsed is None:
             return None
 
@@ -280,19 +372,18 @@ async def _estimate_with_ollama(text: str, task_type: str | None = None) -> Dict
 
 def _normalize_estimate_payload(payload: Dict) -> Dict | None:
     try:
-        estimated_minutes = int(max(1, payload.get("estimated_minutes", 1)))
-        reading_time_minutes = int(max(0, payload.get("reading_time_minutes", 0)))
-        work_time_minutes = int(max(1, payload.get("work_time_minutes", max(1, estimated_minutes - reading_time_minutes))))
+        estimated_minutes = _to_int(payload, "estimated_minutes", 1)
+        reading_time_minutes = _to_int(payload, "reading_time_minutes", 0, lo=0)
+        work_time_minutes = _to_int(payload, "work_time_minutes", max(1, estimated_minutes - reading_time_minutes))
         complexity = str(payload.get("complexity", "medium")).lower()
         if complexity not in {"simple", "medium", "complex"}:
             complexity = "medium"
 
-        confidence_score = float(payload.get("confidence_score", 0.6))
-        confidence_score = max(0.0, min(1.0, confidence_score))
+        confidence_score = _clamp01(payload.get("confidence_score"), 0.6)
 
         recommended = payload.get("recommended_sessions") or {}
-        sessions = int(max(1, recommended.get("sessions", 1)))
-        minutes_per_session = int(max(1, recommended.get("minutes_per_session", max(1, estimated_minutes // sessions))))
+        sessions = _to_int(recommended, "sessions", 1)
+        minutes_per_session = _to_int(recommended, "minutes_per_session", max(1, estimated_minutes // sessions))
         recommendation = str(recommended.get("recommendation", "Split work into focused sessions"))
 
         return {
@@ -302,7 +393,7 @@ def _normalize_estimate_payload(payload: Dict) -> Dict | None:
             "work_time_minutes": work_time_minutes,
             "complexity": complexity,
             "task_type": str(payload.get("task_type", "assignment")),
-            "question_count": int(max(0, payload.get("question_count", 0))),
+            "question_count": _to_int(payload, "question_count", 0, lo=0),
             "has_mathematical_content": bool(payload.get("has_mathematical_content", False)),
             "has_code_content": bool(payload.get("has_code_content", False)),
             "confidence_score": confidence_score,
@@ -315,3 +406,19 @@ def _normalize_estimate_payload(payload: Dict) -> Dict | None:
         }
     except Exception:
         return None
+
+
+def _to_int(data: Dict, key: str, default: int, lo: int = 1) -> int:
+    """`data[key]` as an int of at least `lo`; `default` when missing or not numeric."""
+    value = data.get(key, default)
+    try:
+        return max(lo, int(value))
+    except (TypeError, ValueError, OverflowError):
+        return default
+
+
+def _clamp01(value, default: float) -> float:
+    try:
+        return max(0.0, min(1.0, float(value)))
+    except (TypeError, ValueError):
+        return default
@@ -1,12 +1,14 @@
+import uuid
 from datetime import datetime
-from difflib import SequenceMatcher
+from functools import lru_cache
 from uuid import UUID
 
 from fastapi import HTTPException
-from sqlalchemy import and_, delete, select
+from rapidfuzz import fuzz, process
+from sqlalchemy import and_, delete, exists, func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.attendance import AttendanceRecord, Subject
+from app.models.attendance import AttendanceRecord, AttendanceStatus, Subject
 from app.models.timetable import TimetableDocument, TimetableEntry
 from app.services.ollama_timetable_extractor import OllamaTimetableExtractor
 
@@ -14,34 +16,49 @@ from app.services.ollama_timetable_extractor import OllamaTimetableExtractor
 DAY_NAMES = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
 
 
+# A timetable repeats the same handful of slot times, and strptime re-runs its format
+# machinery on every call; `time` objects are immutable, so parsed values are shared.
+@lru_cache(maxsize=1024)
 def _parse_time_string(value: str):
     return datetime.strptime(value, "%H:%M").time()
 
 
-async def match_subject_to_database(extracted_name: str, user_id: UUID, db: AsyncSession) -> UUID | None:
-    result = await db.execute(select(Subject).where(Subject.user_id == user_id))
-    subjects = list(result.scalars().all())
-    if not subjects:
-        return None
+class _SubjectIndex:
+    """A user's subject names and codes, lowercased once, for repeated matching.
 
-    extracted_lower = extracted_name.lower()
-    best_match = None
-    best_score = 0.0
+    Names and codes are scored side by side; `owners[i]` is the subject behind
+    `choices[i]`. `exact` maps each key to its first subject.
+    """
 
-    for subject in subjects:
-        compare_items = [subject.name.lower()]
-        if subject.code:
-            compare_items.append(subject.code.lower())
-
-        for compare_text in compare_items:
-            score = SequenceMatcher(None, extracted_lower, compare_text).ratio()
-            if score > best_score:
-                best_score = score
-                best_match = subject
+    def __init__(self, subjects):
+        self.choices: list[str] = []
+        self.owners: list[Subject] = []
+        self.exact: dict[str, Subject] = {}
+        for subject in subjects:
+            self.add(subject)
 
-    if best_match and best_score >= 0.7:
-        return best_match.id
-    return None
+    def add(self, subject: Subject) -> None:
+        keys = [subject.name.lower()]
+        if subject.code:
+            keys.append(subject.code.lower())
+        for key in keys:
+            self.choices.append(key)
+            self.owners.append(subject)
+            self.exact.setdefault(key, subject)
+
+    def match(self, extracted_name: str) -> UUID | None:
+        # Most extracted names equal a stored name or code; the first such choice is
+        # exactly what the fuzzy scan would return (score 100, earliest wins), so skip it.
+        target = extracted_name.lower()
+        if target in self.exact:
+            return self.exact[target].id
+
+        if not self.choices:
+            return None
+        best = process.extractOne(target, self.choices, scorer=fuzz.ratio, score_cutoff=70)
+        if best is None:
+            return None
+        return self.owners[best[2]].id
 
 
 async def process_timetable_upload(user_id: UUID, file_name: str, file_path: str, file_type: str, db: AsyncSession) -> dict:
@@ -64,6 +81,7 @@ async def process_timetable_upload(user_id: UUID, file_name: str, file_path: str
         doc.extraction_status = "failed"
         doc.error_message = result.get("error", "Extraction failed")
         doc.extracted_data = {"error": doc.error_message}
+        await db.flush()
         return {
             "status": "failed",
             "document_id": doc.id,
@@ -72,16 +90,29 @@ async def process_timetable_upload(user_id: UUID, file_name: str, file_path: str
             "error": doc.error_message,
         }
 
+    # Fetch the user's subjects once and index them; subjects created below are added
+    # so later entries can match them without another query.
+    subjects_result = await db.execute(select(Subject).where(Subject.user_id == user_id))
+    subjects = _SubjectIndex(subjects_result.scalars().all())
+    new_subjects: list[Subject] = []
+
+    # A subject usually fills several slots; resolve each distinct name once per upload.
+    match_cache: dict[str, UUID] = {}
+
     final_entries = []
     for entry in result.get("entries", []):
         subject_name = entry["subject"].strip()
-        subject_id = await match_subject_to_database(subject_name, user_id, db)
+        cache_key = subject_name.lower()
+        subject_id = match_cache.get(cache_key) or subjects.match(subject_name)
         if not subject_id:
             code = "".join([c for c in subject_name.upper() if c.isalnum() or c == " "]).replace(" ", "")[:10]
-            subject = Subject(user_id=user_id, name=subject_name, code=code or None)
-            db.add(subject)
-            await db.flush()
+            # The id is assigned up front so the entry can reference it before the
+            # batch below is flushed.
+            subject = Subject(id=uuid.uuid4(), user_id=user_id, name=subject_name, code=code or None)
+            subjects.add(subject)
+            new_subjects.append(subject)
             subject_id = subject.id
+        match_cache[cache_key] = subject_id
 
         final_entries.append({
             "subject_id": str(subject_id),
@@ -101,6 +132,11 @@ async def process_timetable_upload(user_id: UUID, file_name: str, file_path: str
         "notes": result.get("notes", ""),
     }
 
+    # One flush writes the document's final state and every new subject; with primary
+    # keys already set the subjects go out as a single executemany INSERT.
+    db.add_all(new_subjects)
+    await db.flush()
+
     return {
         "status": "success",
         "document_id": doc.id,
@@ -113,51 +149,63 @@ async def process_timetable_upload(user_id: UUID, file_name: str, file_path: str
 async def bulk_save_timetable(user_id: UUID, entries: list[dict], db: AsyncSession) -> dict:
     await db.execute(delete(TimetableEntry).where(TimetableEntry.user_id == user_id))
 
-    for entry_data in entries:
-        timetable_entry = TimetableEntry(
-            user_id=user_id,
-            subject_id=entry_data["subject_id"],
-            day_of_week=entry_data["day_of_week"],
-            start_time=_parse_time_string(entry_data["start_time"]),
-            end_time=_parse_time_string(entry_data["end_time"]),
-            room=entry_data.get("room"),
-            notes=entry_data.get("notes"),
-            is_active=True,
-        )
-        db.add(timetable_entry)
-
-    await db.flush()
+    # A single multi-row INSERT ... VALUES statement: one round-trip on every driver,
+    # instead of per-object unit-of-work bookkeeping or a driver-level executemany.
+    rows = [
+        {
+            "user_id": user_id,
+            "subject_id": entry_data["subject_id"],
+            "day_of_week": entry_data["day_of_week"],
+            "start_time": _parse_time_string(entry_data["start_time"]),
+            "end_time": _parse_time_string(entry_data["end_time"]),
+            "room": entry_data.get("room"),
+            "notes": entry_data.get("notes"),
+            "is_active": True,
+        }
+        for entry_data in entries
+    ]
+    if rows:
+        await db.execute(insert(TimetableEntry).values(rows))
     return {"status": "success", "saved": len(entries)}
 
 
+# Read-only listings select plain columns rather than TimetableEntry/Subject objects,
+# which skips ORM instantiation and identity-map bookkeeping per row.
+_ENTRY_COLUMNS = (
+    TimetableEntry.id,
+    TimetableEntry.subject_id,
+    Subject.name.label("subject_name"),
+    TimetableEntry.day_of_week,
+    TimetableEntry.start_time,
+    TimetableEntry.end_time,
+    TimetableEntry.room,
+    TimetableEntry.notes,
+    TimetableEntry.is_active,
+)
+
+
+def _entry_row_to_dict(row) -> dict:
+    return {
+        **row,
+        "start_time": row["start_time"].strftime("%H:%M"),
+        "end_time": row["end_time"].strftime("%H:%M"),
+    }
+
+
 async def get_timetable_entries(user_id: UUID, db: AsyncSession) -> list[dict]:
     result = await db.execute(
-        select(TimetableEntry, Subject)
+        select(*_ENTRY_COLUMNS)
         .join(Subject, TimetableEntry.subject_id == Subject.id)
         .where(TimetableEntry.user_id == user_id)
         .order_by(TimetableEntry.day_of_week, TimetableEntry.start_time)
     )
-
-    items = []
-    for entry, subject in result.all():
-        items.append({
-            "id": entry.id,
-            "subject_id": entry.subject_id,
-            "subject_name": subject.name,
-            "day_of_week": entry.day_of_week,
-            "start_time": entry.start_time.strftime("%H:%M"),
-            "end_time": entry.end_time.strftime("%H:%M"),
-            "room": entry.room,
-            "notes": entry.notes,
-            "is_active": entry.is_active,
-        })
-    return items
+    return [_entry_row_to_dict(row) for row in result.mappings()]
 
 
 async def get_today_classes(user_id: UUID, db: AsyncSession) -> list[dict]:
     weekday = datetime.now().weekday()
     result = await db.execute(
-        select(TimetableEntry, Subject)
+        select(*_ENTRY_COLUMNS)
         .join(Subject, TimetableEntry.subject_id == Subject.id)
         .where(
             and_(
@@ -168,21 +216,7 @@ async def get_today_classes(user_id: UUID, db: AsyncSession) -> list[dict]:
         )
         .order_by(TimetableEntry.start_time)
     )
-
-    classes = []
-    for entry, subject in result.all():
-        classes.append({
-            "id": entry.id,
-            "subject_id": entry.subject_id,
-            "subject_name": subject.name,
-            "day_of_week": entry.day_of_week,
-            "start_time": entry.start_time.strftime("%H:%M"),
-            "end_time": entry.end_time.strftime("%H:%M"),
-            "room": entry.room,
-            "notes": entry.notes,
-            "is_active": entry.is_active,
-        })
-    return classes
+    return [_entry_row_to_dict(row) for row in result.mappings()]
 
 
 async def delete_timetable_entry(user_id: UUID, entry_id: UUID, db: AsyncSession) -> None:
@@ -200,8 +234,22 @@ async def get_morning_checkin(user_id: UUID, db: AsyncSession) -> dict:
     day_of_week = today.weekday()
     today_date = today.date()
 
+    is_marked = exists().where(
+        and_(
+            AttendanceRecord.user_id == user_id,
+            AttendanceRecord.subject_id == TimetableEntry.subject_id,
+            AttendanceRecord.class_date == today_date,
+        )
+    )
     result = await db.execute(
-        select(TimetableEntry, Subject)
+        select(
+            TimetableEntry.subject_id,
+            Subject.name,
+            TimetableEntry.start_time,
+            TimetableEntry.end_time,
+            TimetableEntry.room,
+            is_marked.label("is_marked"),
+        )
         .join(Subject, TimetableEntry.subject_id == Subject.id)
         .where(
             and_(
@@ -212,27 +260,16 @@ async def get_morning_checkin(user_id: UUID, db: AsyncSession) -> dict:
         )
         .order_by(TimetableEntry.start_time)
     )
-    classes = result.all()
-
-    marked_result = await db.execute(
-        select(AttendanceRecord.subject_id).where(
-            and_(
-                AttendanceRecord.user_id == user_id,
-                AttendanceRecord.class_date == today_date,
-            )
-        )
-    )
-    marked_ids = {subject_id for (subject_id,) in marked_result.all()}
 
     payload_classes = []
-    for entry, subject in classes:
+    for row in result.all():
         payload_classes.append({
-            "subject_id": entry.subject_id,
-            "subject_name": subject.name,
-            "start_time": entry.start_time.strftime("%H:%M"),
-            "end_time": entry.end_time.strftime("%H:%M"),
-            "room": entry.room,
-            "is_marked": entry.subject_id in marked_ids,
+            "subject_id": row.subject_id,
+            "subject_name": row.name,
+            "start_time": row.start_time.strftime("%H:%M"),
+            "end_time": row.end_time.strftime("%H:%M"),
+            "room": row.room,
+            "is_marked": bool(row.is_marked),
         })
 
     marked_count = len([c for c in payload_classes if c["is_marked"]])
@@ -250,38 +287,37 @@ async def get_unmarked_classes(user_id: UUID, db: AsyncSession) -> dict:
     today_date = now.date()
     current_time = now.time()
 
+    # Anti-join: classes with no attendance record for today. uq_attendance_per_day
+    # guarantees at most one matching record, so the outer join never duplicates rows.
     result = await db.execute(
         select(TimetableEntry, Subject)
         .join(Subject, TimetableEntry.subject_id == Subject.id)
+        .outerjoin(
+            AttendanceRecord,
+            and_(
+                AttendanceRecord.subject_id == TimetableEntry.subject_id,
+                AttendanceRecord.user_id == user_id,
+                AttendanceRecord.class_date == today_date,
+            ),
+        )
         .where(
             and_(
                 TimetableEntry.user_id == user_id,
                 TimetableEntry.day_of_week == day_of_week,
                 TimetableEntry.end_time < current_time,
                 TimetableEntry.is_active.is_(True),
+                AttendanceRecord.id.is_(None),
             )
         )
     )
-    ended_classes = result.all()
-
-    marked_result = await db.execute(
-        select(AttendanceRecord.subject_id).where(
-            and_(
-                AttendanceRecord.user_id == user_id,
-                AttendanceRecord.class_date == today_date,
-            )
-        )
-    )
-    marked_ids = {subject_id for (subject_id,) in marked_result.all()}
 
     unmarked = []
-    for entry, subject in ended_classes:
-        if entry.subject_id not in marked_ids:
-            unmarked.append({
-                "subject_id": entry.subject_id,
-                "subject_name": subject.name,
-                "time": f"{entry.start_time.strftime('%H:%M')}-{entry.end_time.strftime('%H:%M')}",
-            })
+    for entry, subject in result.all():
+        unmarked.append({
+            "subject_id": entry.subject_id,
+            "subject_name": subject.name,
+            "time": f"{entry.start_time.strftime('%H:%M')}-{entry.end_time.strftime('%H:%M')}",
+        })
 
     return {
         "type": "unmarked",
@@ -295,8 +331,10 @@ async def get_end_of_day_summary(user_id: UUID, db: AsyncSession) -> dict:
     day_of_week = today.weekday()
     today_date = today.date()
 
-    classes_result = await db.execute(
-        select(TimetableEntry).where(
+    # Both counts run on the request session, so they share its transaction and see
+    # attendance marked earlier in the same request.
+    total_classes = await db.scalar(
+        select(func.count()).select_from(TimetableEntry).where(
             and_(
                 TimetableEntry.user_id == user_id,
                 TimetableEntry.day_of_week == day_of_week,
@@ -304,28 +342,25 @@ async def get_end_of_day_summary(user_id: UUID, db: AsyncSession) -> dict:
             )
         )
     )
-    classes = list(classes_result.scalars().all())
-
-    records_result = await db.execute(
-        select(AttendanceRecord).where(
+    status_rows = await db.execute(
+        select(AttendanceRecord.status, func.count())
+        .where(
             and_(
                 AttendanceRecord.user_id == user_id,
                 AttendanceRecord.class_date == today_date,
             )
         )
+        .group_by(AttendanceRecord.status)
     )
-    records = list(records_result.scalars().all())
-
-    present_count = len([r for r in records if str(r.status) == "present"])
-    absent_count = len([r for r in records if str(r.status) == "absent"])
-    late_count = len([r for r in records if str(r.status) == "late"])
+    counts = dict(status_rows.all())
+    marked_classes = sum(counts.values())
 
     return {
         "type": "end_of_day",
-        "total_classes": len(classes),
-        "marked_classes": len(records),
-        "present_count": present_count,
-        "absent_count": absent_count,
-        "late_count": late_count,
-        "unmarked_count": max(0, len(classes) - len(records)),
+        "total_classes": total_classes,
+        "marked_classes": marked_classes,
+        "present_count": counts.get(AttendanceStatus.present, 0),
+        "absent_count": counts.get(AttendanceStatus.absent, 0),
+        "late_count": counts.get(AttendanceStatus.late, 0),
+        "unmarked_count": max(0, total_classes - marked_classes),
     }
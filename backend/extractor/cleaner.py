@@ -4,26 +4,30 @@ import re
 import unicodedata
 from collections import Counter
 
+# Lines are stripped and non-empty before joining, so no run of whitespace can touch a
+# newline: collapsing every run of 2+ whitespace chars, plus lone tabs, to one space is
+# the whole clean-up in a single pass.
+_WHITESPACE_RUN_RE = re.compile(r"\s{2,}|\t")
+
 
 def normalize_text(raw_text: str) -> str:
     text = raw_text or ""
     text = unicodedata.normalize("NFKC", text)
 
-    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    lines = [stripped for line in text.splitlines() if (stripped := line.strip())]
     lines = _remove_repeated_headers_footers(lines)
 
     text = "\n".join(lines)
-    text = text.replace("\r", "\n")
-    text = re.sub(r"[\t ]+", " ", text)
-    text = re.sub(r"\n{2,}", "\n", text)
-    text = re.sub(r"\s{2,}", " ", text)
-    return text.strip()
+    return _WHITESPACE_RUN_RE.sub(" ", text)
 
 
 def _remove_repeated_headers_footers(lines: list[str]) -> list[str]:
     if len(lines) < 8:
         return lines
 
-    counts = Counter(lines)
-    blocked = {line for line, count in counts.items() if count >= 3 and len(line) <= 120}
+    # Only short lines can be headers/footers; long body lines never enter the Counter.
+    counts = Counter(line for line in lines if len(line) <= 120)
+    blocked = {line for line, count in counts.items() if count >= 3}
+    if not blocked:
+        return lines
     return [line for line in lines if line not in blocked]
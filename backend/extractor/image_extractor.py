@@ -1,11 +1,58 @@
 from __future__ import annotations
 
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
 from extractor.ocr_engine import ocr_image_path
 
 
-def extract_image_text(file_path: str) -> dict:
+# Workers are spawned, not forked from the multi-threaded API process, and capped
+# so each OCR process's memory isn't multiplied by every core.
+_MAX_WORKERS = min(4, os.cpu_count() or 1)
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=_MAX_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pool
+
+
+def _discard_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next call starts a fresh one."""
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _ocr_in_pool(file_path: str, timeout: float) -> str:
+    # A worker killed mid-job (crash, OOM) breaks the whole pool; without a reset every
+    # later OCR call would fail with BrokenProcessPool. Retry once on a fresh pool.
+    for attempt in range(2):
+        pool = _get_pool()
+        try:
+            return pool.submit(ocr_image_path, file_path, timeout).result()
+        except BrokenProcessPool:
+            _discard_pool(pool)
+            if attempt:
+                raise
+
+
+def extract_image_text(file_path: str, timeout: float = 0) -> dict:
     return {
-        "text": ocr_image_path(file_path),
+        "text": _ocr_in_pool(file_path, timeout),
         "used_ocr": True,
         "tables": [],
     }
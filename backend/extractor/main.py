@@ -56,7 +56,8 @@ def _extract_text_by_type(file_path: str, doc_type: str) -> dict:
     if doc_type == "docx":
         return extract_docx_text(file_path)
     if doc_type == "image":
-        return extract_image_text(file_path)
+        # The outer timeout only stops waiting; this one kills the tesseract run itself.
+        return extract_image_text(file_path, timeout=EXTRACTION_TIMEOUT_SECONDS)
     if doc_type == "txt":
         return _extract_text_file(file_path)
     raise ValueError(f"Unsupported document type: {doc_type}")
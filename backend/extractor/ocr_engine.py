@@ -12,10 +12,11 @@ def ocr_image_bytes(image_bytes: bytes) -> str:
     return pytesseract.image_to_string(image)
 
 
-def ocr_image_path(file_path: str) -> str:
+def ocr_image_path(file_path: str, timeout: float = 0) -> str:
+    """`timeout` > 0 kills the tesseract run after that many seconds (RuntimeError)."""
     image = Image.open(file_path)
     image = _preprocess(image)
-    return pytesseract.image_to_string(image)
+    return pytesseract.image_to_string(image, timeout=timeout)
 
 
 def _preprocess(image: Image.Image) -> Image.Image:
@@ -52,6 +52,7 @@ CREATE TABLE assignments (
 CREATE INDEX idx_assignments_user_id ON assignments(user_id);
 CREATE INDEX idx_assignments_deadline ON assignments(deadline);
 CREATE INDEX idx_assignments_status   ON assignments(status);
+CREATE INDEX ix_assign_user_deadline  ON assignments(user_id, status, deadline);
 
 -- ============================================================
 -- TABLE: subjects
@@ -118,6 +119,7 @@ CREATE TABLE activities (
 
 CREATE INDEX idx_activities_user_id ON activities(user_id);
 CREATE INDEX idx_activities_date    ON activities(activity_date);
+CREATE INDEX ix_activity_user_date  ON activities(user_id, activity_date);
 
 -- ============================================================
 -- TABLE: documents
@@ -182,6 +184,10 @@ CREATE TABLE alerts (
 CREATE INDEX idx_alerts_user_id  ON alerts(user_id);
 CREATE INDEX idx_alerts_is_read  ON alerts(is_read);
 CREATE INDEX idx_alerts_type     ON alerts(alert_type);
+CREATE INDEX ix_alerts_user_unread ON alerts(user_id, is_read, created_at);
+CREATE INDEX ix_alerts_user_type_unread ON alerts(user_id, alert_type, is_read);
+CREATE INDEX ix_alerts_related_assignment ON alerts(related_assignment_id);
+CREATE INDEX ix_alerts_related_subject ON alerts(related_subject_id);
 
 -- ============================================================
 -- HELPER FUNCTION: update updated_at automatically
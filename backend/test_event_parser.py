@@ -0,0 +1,111 @@
+"""
+Check the college-events parser against fixed expectations and the baseline helpers.
+
+Run from backend/:  python test_event_parser.py
+"""
+import random
+
+from app.college_events.event_parser import (
+    _classify_event_type,
+    _extract_department,
+    parse_events_from_page,
+)
+
+LINES = 100_000
+
+WORDS = [
+    "the", "students", "of", "will", "on", "campus", "hall", "schedule", "released", "for",
+    "notice", "exam", "Holiday", "BREAK", "workshop", "seminar", "midsem", "calendar",
+    "test", "Assessment", "ENDSEM", "vacation", "Lecture", "computer", "IT", "extc",
+    "mechanical", "Civil", "electronics", "electrical", "AI", "Data Science", "semester 5",
+    "15/08/2024", "3 March 2024", "Jan 5, 2025", "bait", "waiting", "latest",
+]
+
+PAGE = """Mid semester exam for Computer students begins on 15/08/2024 in the main hall
+Diwali holiday notice: college remains closed from 3 March 2024 for all students
+Guest lecture on Data Science for sem 5 students on Jan 5, 2025 at the auditorium
+Short line
+Orientation workshop for Mechanical semester 1 students scheduled on 12-07-24
+Random text line with a date 01/01/2023 but nothing else interesting here
+Summer vacation break announced for civil department students 31/12/2024
+Result notice about the exam on March 5, 2024 and the re-test on 1 may 2024"""
+
+# (event_type, date, semester, department) per event, as the original parser produced them.
+EXPECTED = {
+    "https://college.edu/notices": [
+        ("Exam", "2024-08-15", None, "Computer"),
+        ("Holiday", "2024-03-03", None, "Ai"),
+        ("Lecture", "2025-01-05", "sem 5", "It"),
+        ("Lecture", "2024-07-12", "semester 1", "Mechanical"),
+        ("Holiday", "2024-12-31", None, "Civil"),
+        ("Exam", "2024-05-01", None, None),
+    ],
+    # Calendar sources also keep dated lines without an event keyword.
+    "https://college.edu/academic-calendar.pdf": [
+        ("Exam", "2024-08-15", None, "Computer"),
+        ("Holiday", "2024-03-03", None, "Ai"),
+        ("Lecture", "2025-01-05", "sem 5", "It"),
+        ("Lecture", "2024-07-12", "semester 1", "Mechanical"),
+        ("Notice", "2023-01-01", None, "It"),
+        ("Holiday", "2024-12-31", None, "Civil"),
+        ("Exam", "2024-05-01", None, None),
+    ],
+}
+
+
+def baseline_event_type(text: str) -> str:
+    """_classify_event_type from the original parser, keyword lists included."""
+    lowered = text.lower()
+    if any(k in lowered for k in ["exam", "test", "assessment", "midsem", "endsem"]):
+        return "Exam"
+    if any(k in lowered for k in ["holiday", "vacation", "break"]):
+        return "Holiday"
+    if any(k in lowered for k in ["lecture", "seminar", "workshop"]):
+        return "Lecture"
+    return "Notice"
+
+
+def baseline_department(text: str) -> str | None:
+    """_extract_department from the original parser, department list included."""
+    depts = ["computer", "it", "extc", "mechanical", "civil", "electronics", "electrical", "ai", "data science"]
+    lowered = text.lower()
+    for dept in depts:
+        if dept in lowered:
+            return dept.title()
+    return None
+
+
+def check_page() -> bool:
+    print("Parsing the sample page...")
+    ok = True
+    for url, expected in EXPECTED.items():
+        events = parse_events_from_page(PAGE, url, "Test College")
+        got = [(e["event_type"], e["date"], e["semester"], e["department"]) for e in events]
+        if got == expected:
+            print(f"✅ {url}: {len(got)} events as expected")
+        else:
+            ok = False
+            print(f"❌ {url}\n   expected {expected}\n   got      {got}")
+    return ok
+
+
+def check_helpers(rng: random.Random) -> bool:
+    print(f"\nComparing helpers with the baseline on {LINES:,} generated lines...")
+    mismatches = 0
+    for _ in range(LINES):
+        line = " ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 30)))
+        if _classify_event_type(line) != baseline_event_type(line):
+            mismatches += 1
+        if _extract_department(line) != baseline_department(line):
+            mismatches += 1
+    if mismatches:
+        print(f"❌ {mismatches} mismatches")
+        return False
+    print("✅ identical output")
+    return True
+
+
+if __name__ == "__main__":
+    ok = check_page()
+    ok = check_helpers(random.Random(12)) and ok
+    raise SystemExit(0 if ok else 1)